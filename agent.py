@@ -1,9 +1,19 @@
+import asyncio
+import copy
+import functools
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from agents import Agent
 from agents.tools import ToolContext
-from google import genai
-from google.genai import types
-from google.cloud import storage
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 # Mock Data and Stubbed Functions (Replace with real implementations)
 SAMPLE_IMAGE_URLS = ["gs://site_comparisons/beach_image.png"]
@@ -13,19 +23,255 @@ SAMPLE_SOCIAL_MEDIA_POSTS = [
 ]
 SAMPLE_REPORT = "The environmental impact is minimal..."
 
+# --- Gemini Configuration ---
+_MODEL = "gemini-2.0-flash-001"
+_MAX_OUTPUT_TOKENS = 8192
+# Room for one full analysis (terrain, vegetation, infrastructure, environmental impact) per image
+_OUTPUT_TOKENS_PER_IMAGE = 2048
+_MAX_IMAGES_PER_REQUEST = _MAX_OUTPUT_TOKENS // _OUTPUT_TOKENS_PER_IMAGE
+_IMAGE_CONCURRENCY = int(os.environ.get("WINDFARM_IMAGE_CONCURRENCY", "8"))
+# Stop analyzing as soon as any image is found suitable (see _analyze_satellite_images_early_exit)
+_EARLY_EXIT = os.environ.get("WINDFARM_EARLY_EXIT", "").lower() in ("1", "true", "yes")
+# Warm up the Gemini client in the background while the agents plan (see _start_client_warmup)
+_WARMUP = os.environ.get("WINDFARM_WARMUP", "1").lower() in ("1", "true", "yes")
+_PROMPT = """Analyze each of the following satellite images for its suitability for an onshore wind farm. Consider factors like terrain, vegetation, existing infrastructure, and potential environmental impact.
+Return a JSON array with one object per image, where "index" is the 0-based position of the image in this request, "viability" is the image's suitability ("high", "moderate" or "low") and "analysis" is the analysis of that image."""
+_IMAGE_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "tif": "image/tiff",
+    "tiff": "image/tiff",
+}
+_SAFETY_CATEGORIES = (
+    "HARM_CATEGORY_HATE_SPEECH",
+    "HARM_CATEGORY_DANGEROUS_CONTENT",
+    "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+    "HARM_CATEGORY_HARASSMENT",
+)
+_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "index": {"type": "INTEGER"},
+            "viability": {"type": "STRING", "enum": ["high", "moderate", "low"]},
+            "analysis": {"type": "STRING", "nullable": True},
+        },
+        "required": ["index", "viability", "analysis"],
+    },
+}
+# Ordered from worst to best; the overall viability is the best of the per-image ratings
+_VIABILITY_LEVELS = ("low", "moderate", "high")
+# Matches a high rating in the raw JSON stream, before the response is complete
+_HIGH_VIABILITY_RE = re.compile(r'"viability"\s*:\s*"high"')
+
+# google-genai is imported on first use so agents that never call Gemini don't pay for it at import time.
+_genai = None
+_types = None
+
+
+def _lazy_genai():
+    """Imports and returns the (genai, types) modules, importing them on first use."""
+    global _genai, _types
+    if _genai is None:
+        from google import genai
+        from google.genai import types
+        _genai, _types = genai, types
+    return _genai, _types
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> "genai.Client":
+    """Returns the shared Vertex AI Gemini client, creating it on first use."""
+    global _client
+    # Locked so the warm-up and the first analysis can't each build a client
+    with _client_lock:
+        if _client is None:
+            _client = _build_client()
+        return _client
+
+
+def _build_client() -> "genai.Client":
+    """Builds the Vertex AI Gemini client."""
+    genai, types = _lazy_genai()
+    client_kwargs = {}
+    # client_args/async_client_args only exist in recent SDKs, and HttpOptions rejects unknown fields
+    http_option_fields = getattr(types.HttpOptions, "model_fields", {})
+    if "client_args" in http_option_fields and "async_client_args" in http_option_fields:
+        import httpx
+
+        # At most _IMAGE_CONCURRENCY analysis requests are in flight (see the semaphores in the
+        # analysis paths), plus one for the warm-up, so keep exactly that many connections alive.
+        # When google-genai uses aiohttp for client.aio it ignores these limits; the semaphores still apply.
+        limits = httpx.Limits(
+            max_connections=_IMAGE_CONCURRENCY + 1,
+            max_keepalive_connections=_IMAGE_CONCURRENCY + 1,
+        )
+        client_kwargs["http_options"] = types.HttpOptions(
+            client_args={"limits": limits},
+            async_client_args={"limits": limits},
+        )
+    return genai.Client(
+        vertexai=True,
+        project="platinum-banner-303105",  # Replace with your project ID
+        location="us-central1",
+        **client_kwargs,
+    )
 
-# --- Tool Functions ---
-def get_lat_long(tool_context: ToolContext, location: str) -> Dict:
-    """Retrieves latitude and longitude coordinates for a given location.
 
-    Args:
-        location (str): The name of the location.
+async def _warm_up_client() -> None:
+    """Builds the client and sends a 1-token request through its async client.
 
-    Returns:
-        Dict: A dictionary containing latitude and longitude.
+    That is the client the analysis uses, so its credentials and pooled connection are ready.
     """
+    try:
+        client = await asyncio.to_thread(_get_client)
+        _, types = _lazy_genai()
+        await client.aio.models.generate_content(
+            model=_MODEL,
+            contents=["ping"],
+            config=types.GenerateContentConfig(max_output_tokens=1),
+        )
+    except Exception:
+        pass  # Best effort; the real request will surface any error
+
+
+_warmup_task = None
+
+
+def _start_client_warmup() -> None:
+    """Starts the one-time client warm-up on the running loop, unless disabled with WINDFARM_WARMUP=0."""
+    global _warmup_task
+    if _WARMUP and _warmup_task is None:
+        # Fire and forget; the reference keeps the task from being garbage collected mid-flight
+        _warmup_task = asyncio.create_task(_warm_up_client())
+
+
+# The prompt Part and request config are identical for every call, so they are built once.
+@functools.lru_cache(maxsize=1)
+def _get_text_part() -> "types.Part":
+    """Returns the shared prompt Part for image analysis requests."""
+    _, types = _lazy_genai()
+    return types.Part.from_text(text=_PROMPT)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_generate_content_config() -> "types.GenerateContentConfig":
+    """Returns the shared GenerateContentConfig for image analysis requests."""
+    _, types = _lazy_genai()
+    return types.GenerateContentConfig(
+        temperature=1,
+        top_p=0.95,
+        max_output_tokens=_MAX_OUTPUT_TOKENS,
+        response_modalities=["TEXT"],
+        response_mime_type="application/json",
+        response_schema=_RESPONSE_SCHEMA,
+        safety_settings=[
+            types.SafetySetting(category=category, threshold="OFF")
+            for category in _SAFETY_CATEGORIES
+        ],
+    )
+
+
+# The same image tiles are often reused across calls and neighbouring sites.
+@functools.lru_cache(maxsize=1024)
+def _get_uri_part(image_url: str) -> "types.Part":
+    """Returns the Part for an image URL, inferring its mime type from the file extension."""
+    _, types = _lazy_genai()
+    extension = image_url.rsplit(".", 1)[-1].lower()
+    return types.Part.from_uri(
+        file_uri=image_url,
+        mime_type=_IMAGE_MIME_TYPES.get(extension, "image/png"),
+    )
+
+
+# --- Cached Lookups ---
+# Sibling agents and both locations of a comparison hit the same lookups, and ToolContext
+# isn't hashable, so each tool delegates to a cached function of its plain arguments.
+def _cached_lookup(func):
+    """lru_caches func, handing every caller its own deep copy so the cached result can't be mutated."""
+    cached = functools.lru_cache(maxsize=128)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return copy.deepcopy(cached(*args, **kwargs))
+
+    return wrapper
+
+@_cached_lookup
+def _get_lat_long(location: str) -> Dict:
     return {"latitude": 34.0522, "longitude": -118.2437}  # Mock Los Angeles
 
+@_cached_lookup
+def _get_earth_engine_images(latitude: float, longitude: float) -> Dict:
+    return {"image_urls": SAMPLE_IMAGE_URLS}
+
+@_cached_lookup
+def _search_social_media(location: str) -> Dict:
+    return {"posts": SAMPLE_SOCIAL_MEDIA_POSTS}
+
+@_cached_lookup
+def _check_lawsuits(location: str) -> Dict:
+    return {"lawsuits_found": False}
+
+@_cached_lookup
+def _check_landownership(latitude: float, longitude: float) -> Dict:
+    return {"ownership": "private", "acquisition_difficulty": "high"}
+
+@_cached_lookup
+def _analyze_environmental_report(report: str) -> Dict:
+    return {"key_findings": ["No endangered species", "Low water usage"]}
+
+@_cached_lookup
+def _find_nearest_electrical_hub(latitude: float, longitude: float) -> Dict:
+    return {"distance": 5, "estimated_cost": 50000}
+
+
+# --- Async Tool Support ---
+# Coroutine tools let a framework that awaits tools overlap several tool calls from one LLM turn.
+# The registered tools are sync shims over them, since agent frameworks may call tools synchronously;
+# the shims block while they run, so only the *_async variants can overlap.
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns the background event loop the sync tool shims run on, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+        return _loop
+
+
+def _run_sync(coroutine):
+    """Runs a coroutine on the background event loop and blocks the calling thread until it completes.
+
+    Using one long-lived loop instead of asyncio.run() per call keeps the async Gemini client's
+    pooled connections usable across calls, and avoids asyncio.run()'s error when the caller's
+    thread is already running an event loop. That loop is still blocked for the whole call, so
+    the registered sync shims give the framework no overlap between tool calls; only the
+    *_async variants do.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, _get_event_loop()).result()
+
+
+def _sync_tool(async_tool):
+    """Returns a sync shim for a coroutine tool, named after it without its "_async" suffix."""
+    @functools.wraps(async_tool)
+    def shim(*args, **kwargs):
+        return _run_sync(async_tool(*args, **kwargs))
+
+    shim.__name__ = shim.__qualname__ = async_tool.__name__.removesuffix("_async")
+    return shim
+
+
+# --- Tool Functions ---
 def get_earth_engine_images(tool_context: ToolContext, latitude: float, longitude: float) -> Dict:
     """Retrieves satellite images from Google Earth Engine based on coordinates.
 
@@ -36,89 +282,262 @@ def get_earth_engine_images(tool_context: ToolContext, latitude: float, longitud
     Returns:
         Dict: A dictionary containing image URLs.
     """
-    return {"image_urls": SAMPLE_IMAGE_URLS}
+    return _get_earth_engine_images(round(latitude, 4), round(longitude, 4))
+
+def _batch_image_urls(image_urls: List[str], batch_size: int = _MAX_IMAGES_PER_REQUEST) -> List[List[str]]:
+    """Splits image URLs into batches of at most batch_size."""
+    return [
+        image_urls[i:i + batch_size]
+        for i in range(0, len(image_urls), batch_size)
+    ]
+
+def _build_batch_contents(batch_urls: List[str]) -> List["types.Content"]:
+    """Builds the request contents for one batch of images."""
+    _, types = _lazy_genai()
+    return [
+        types.Content(
+            role="user",
+            parts=[
+                _get_text_part(),
+                *[_get_uri_part(image_url) for image_url in batch_urls]
+            ]
+        )
+    ]
+
+def _image_error(image_url: str, error) -> Dict:
+    """Returns the result entry for an image that could not be analyzed."""
+    return {"viability": None, "analysis": f"Error analyzing image {image_url}: {error}"}
+
+def _map_batch_items(batch_urls: List[str], items: List, missing_error: str) -> List[Dict]:
+    """Maps the objects returned for a batch back onto its image URLs, one entry per image."""
+    by_index = [None] * len(batch_urls)
+    for item in items:
+        index = item.get("index") if isinstance(item, dict) else None
+        if isinstance(index, int) and 0 <= index < len(batch_urls):
+            by_index[index] = item
+
+    return [
+        {"viability": item.get("viability"), "analysis": item["analysis"]}
+        if item and item.get("analysis") else _image_error(image_url, missing_error)
+        for image_url, item in zip(batch_urls, by_index)
+    ]
+
+def _parse_batch_response(batch_urls: List[str], response_text: str) -> List[Dict]:
+    """Maps the JSON array returned for a batch back onto its image URLs."""
+    try:
+        items = json.loads(response_text)
+    except json.JSONDecodeError:
+        # The output hit the token limit mid-array; keep the analyses that did complete
+        items = _parse_partial_array(response_text)
+    return _map_batch_items(batch_urls, items, "no analysis returned")
+
+def _parse_partial_array(response_text: str) -> List:
+    """Returns the complete objects at the start of a JSON array that was cut off mid-stream."""
+    decoder = json.JSONDecoder()
+    items = []
+    pos = response_text.find("[") + 1
+    if not pos:
+        return items
+    while True:
+        while pos < len(response_text) and response_text[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            item, pos = decoder.raw_decode(response_text, pos)
+        except json.JSONDecodeError:
+            return items
+        items.append(item)
 
-def analyze_satellite_images(tool_context: ToolContext, image_urls: List[str]) -> Dict:
-    """Analyzes satellite images to assess viability for an onshore wind farm using gemini-2.0-flash-001.
+def _collect_batch_results(batches: List[List[str]], results: List) -> List[Dict]:
+    """Flattens per-batch results, expanding a failed batch into one error per image."""
+    analysis_results = []
+    for batch_urls, result in zip(batches, results):
+        if isinstance(result, Exception):
+            analysis_results.extend(_image_error(image_url, result) for image_url in batch_urls)
+        else:
+            analysis_results.extend(result)
+
+    return analysis_results
+
+async def _retry_per_image_on_failure(analyze_batch, batch_urls: List[str]) -> List[Dict]:
+    """Runs analyze_batch on a batch, retrying each image in its own request if the batch fails.
+
+    One unreadable or missing image fails the whole request, so the retry keeps errors per image.
+    """
+    try:
+        return await analyze_batch(batch_urls)
+    except Exception:
+        if len(batch_urls) == 1:
+            raise
+        single_batches = [[image_url] for image_url in batch_urls]
+        results = await asyncio.gather(
+            *[analyze_batch(single_batch) for single_batch in single_batches],
+            return_exceptions=True,
+        )
+        return _collect_batch_results(single_batches, results)
+
+async def _analyze_satellite_images_async(client: "genai.Client", image_urls: List[str]) -> List[Dict]:
+    """Analyzes satellite images in batched Gemini requests and returns one result per image.
+
+    Up to _MAX_IMAGES_PER_REQUEST images share a single request, and up to WINDFARM_IMAGE_CONCURRENCY
+    requests run concurrently. If a batch request fails, its images are retried one per request.
 
     Args:
+        client (genai.Client): The shared Gemini client.
         image_urls (List[str]): List of URLs pointing to satellite images in Google Cloud Storage.
 
     Returns:
-        Dict: A dictionary containing viability assessment and detailed analysis.
+        List[Dict]: The viability and analysis text (or error message) for each image, in input order.
     """
-    client = genai.Client(
-        vertexai=True,
-        project="platinum-banner-303105",  # Replace with your project ID
-        location="us-central1",
+    semaphore = asyncio.Semaphore(_IMAGE_CONCURRENCY)
+
+    async def _analyze_batch(batch_urls: List[str]) -> List[Dict]:
+        async with semaphore:
+            response = await client.aio.models.generate_content(
+                model=_MODEL,
+                contents=_build_batch_contents(batch_urls),
+                config=_get_generate_content_config(),
+            )
+        return _parse_batch_response(batch_urls, response.text)
+
+    batches = _batch_image_urls(image_urls)
+    results = await asyncio.gather(
+        *[_retry_per_image_on_failure(_analyze_batch, batch_urls) for batch_urls in batches],
+        return_exceptions=True,
     )
 
-    analysis_results = []
+    return _collect_batch_results(batches, results)
+
+async def _analyze_satellite_images_early_exit(client: "genai.Client", image_urls: List[str]) -> List[Dict]:
+    """Streaming variant of _analyze_satellite_images_async that stops once any image looks suitable.
+
+    Every batch is streamed concurrently and scanned for a "high" viability rating as chunks arrive.
+    Once the object holding the first hit is complete, all streams stop. The objects each batch had
+    completed by then are returned, and its remaining images are reported as stopped early.
 
-    for image_url in image_urls:
+    Args:
+        client (genai.Client): The shared Gemini client.
+        image_urls (List[str]): List of URLs pointing to satellite images in Google Cloud Storage.
+
+    Returns:
+        List[Dict]: The viability and analysis text (or error message) for each image, in input order.
+    """
+    found = asyncio.Event()
+
+    semaphore = asyncio.Semaphore(_IMAGE_CONCURRENCY)
+
+    async def _stream_batch(batch_urls: List[str]) -> List[Dict]:
+        async with semaphore:
+            return await _read_stream(batch_urls)
+
+    async def _read_stream(batch_urls: List[str]) -> List[Dict]:
+        stream = await client.aio.models.generate_content_stream(
+            model=_MODEL,
+            contents=_build_batch_contents(batch_urls),
+            config=_get_generate_content_config(),
+        )
+        parts = []
+        tail = ""
+        hit = False
         try:
-            image1 = types.Part.from_uri(
-                file_uri=image_url,
-                mime_type="image/png",
-            )
-            text1 = types.Part.from_text(text="""Analyze this satellite image for its suitability for an onshore wind farm. Consider factors like terrain, vegetation, existing infrastructure, and potential environmental impact.""")
-
-            model = "gemini-2.0-flash-001"
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[
-                        image1,
-                        text1
-                    ]
-                )
-            ]
-            generate_content_config = types.GenerateContentConfig(
-                temperature=1,
-                top_p=0.95,
-                max_output_tokens=8192,
-                response_modalities=["TEXT"],
-                safety_settings=[types.SafetySetting(
-                    category="HARM_CATEGORY_HATE_SPEECH",
-                    threshold="OFF"
-                ), types.SafetySetting(
-                    category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                    threshold="OFF"
-                ), types.SafetySetting(
-                    category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                    threshold="OFF"
-                ), types.SafetySetting(
-                    category="HARM_CATEGORY_HARASSMENT",
-                    threshold="OFF"
-                )],
-            )
+            async for chunk in stream:
+                if found.is_set() and not hit:
+                    break
+                text = chunk.text or ""
+                parts.append(text)
+                # Keep the end of the previous chunk so a rating split across chunks still matches
+                if not hit and _HIGH_VIABILITY_RE.search(tail + text):
+                    found.set()
+                    hit = True
+                # The rating may arrive before the rest of its object, so stop once that object is complete
+                if hit and any(
+                    isinstance(item, dict) and item.get("viability") == "high"
+                    for item in _parse_partial_array("".join(parts))
+                ):
+                    break
+                tail = (tail + text)[-32:]
+            else:
+                return _parse_batch_response(batch_urls, "".join(parts))
+        finally:
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+
+        return _map_batch_items(batch_urls, _parse_partial_array("".join(parts)), "stopped early")
+
+    batches = _batch_image_urls(image_urls)
+    results = await asyncio.gather(
+        *[_retry_per_image_on_failure(_stream_batch, batch_urls) for batch_urls in batches],
+        return_exceptions=True,
+    )
 
-            response_text = ""
-            for chunk in client.models.generate_content_stream(
-                    model=model,
-                    contents=contents,
-                    config=generate_content_config,
-            ):
-                response_text += chunk.text
+    return _collect_batch_results(batches, results)
 
-            analysis_results.append(response_text)
+async def _analyze_satellite_images_threaded(client: "genai.Client", image_urls: List[str]) -> List[Dict]:
+    """Thread pool fallback for _analyze_satellite_images_async when the SDK has no async client.
 
-        except Exception as e:
-            analysis_results.append(f"Error analyzing image {image_url}: {e}")
+    Each image gets its own request so the sync calls can overlap; they are network-bound and
+    release the GIL while waiting. The pool size is capped by WINDFARM_IMAGE_CONCURRENCY.
 
-    # Combine analysis results into a summary
-    summary = "\n".join(analysis_results)
+    Args:
+        client (genai.Client): The shared Gemini client.
+        image_urls (List[str]): List of URLs pointing to satellite images in Google Cloud Storage.
+
+    Returns:
+        List[Dict]: The viability and analysis text (or error message) for each image, in input order.
+    """
+    loop = asyncio.get_running_loop()
+
+    def _analyze_batch(batch_urls: List[str]) -> List[Dict]:
+        response = client.models.generate_content(
+            model=_MODEL,
+            contents=_build_batch_contents(batch_urls),
+            config=_get_generate_content_config(),
+        )
+        return _parse_batch_response(batch_urls, response.text)
+
+    batches = _batch_image_urls(image_urls, batch_size=1)
+    with ThreadPoolExecutor(max_workers=max(1, min(_IMAGE_CONCURRENCY, len(batches)))) as executor:
+        results = await asyncio.gather(
+            *[loop.run_in_executor(executor, _analyze_batch, batch_urls) for batch_urls in batches],
+            return_exceptions=True,
+        )
+
+    return _collect_batch_results(batches, results)
+
+async def analyze_satellite_images_async(tool_context: ToolContext, image_urls: List[str]) -> Dict:
+    """Analyzes satellite images to assess viability for an onshore wind farm using gemini-2.0-flash-001.
+
+    Images are batched into as few Gemini requests as possible, and the requests run concurrently.
+    With WINDFARM_EARLY_EXIT set, analysis stops early once any image is found suitable.
 
-    # Example viability assessment (replace with more sophisticated logic)
-    if "suitable" in summary.lower() or "terrain" in summary.lower():
-        viability = "high"
-    elif "some" in summary.lower() or "moderate" in summary.lower():
-        viability = "moderate"
+    Args:
+        image_urls (List[str]): List of URLs pointing to satellite images in Google Cloud Storage.
+
+    Returns:
+        Dict: A dictionary containing viability assessment and detailed analysis.
+    """
+    # The first call does blocking credential discovery, so keep it off the event loop
+    client = await asyncio.to_thread(_get_client)
+    if not hasattr(client, "aio"):
+        analysis_results = await _analyze_satellite_images_threaded(client, image_urls)
+    elif _EARLY_EXIT:
+        analysis_results = await _analyze_satellite_images_early_exit(client, image_urls)
     else:
-        viability = "low"
+        analysis_results = await _analyze_satellite_images_async(client, image_urls)
+
+    # Combine analysis results into a summary
+    summary = "\n".join(result["analysis"] for result in analysis_results)
+
+    # The site is as viable as its best image; images that failed to analyze don't count
+    viability = max(
+        (result["viability"] for result in analysis_results if result["viability"] in _VIABILITY_LEVELS),
+        key=_VIABILITY_LEVELS.index,
+        default="low",
+    )
 
     return {"viability": viability, "analysis": summary}
 
+analyze_satellite_images = _sync_tool(analyze_satellite_images_async)
+
 def search_social_media(tool_context: ToolContext, location: str) -> Dict:
     """Searches social media for posts related to a location.
 
@@ -128,7 +547,7 @@ def search_social_media(tool_context: ToolContext, location: str) -> Dict:
     Returns:
         Dict: A dictionary containing social media posts.
     """
-    return {"posts": SAMPLE_SOCIAL_MEDIA_POSTS}
+    return _search_social_media(location)
 
 def check_lawsuits(tool_context: ToolContext, location: str) -> Dict:
     """Checks for existing lawsuits related to a location.
@@ -139,7 +558,7 @@ def check_lawsuits(tool_context: ToolContext, location: str) -> Dict:
     Returns:
         Dict: A dictionary indicating if lawsuits were found.
     """
-    return {"lawsuits_found": False}
+    return _check_lawsuits(location)
 
 def check_landownership(tool_context: ToolContext, latitude: float, longitude: float) -> Dict:
     """Checks land ownership and acquisition difficulty based on coordinates.
@@ -151,7 +570,7 @@ def check_landownership(tool_context: ToolContext, latitude: float, longitude: f
     Returns:
         Dict: A dictionary containing ownership information and acquisition difficulty.
     """
-    return {"ownership": "private", "acquisition_difficulty": "high"}
+    return _check_landownership(round(latitude, 4), round(longitude, 4))
 
 def analyze_environmental_report(tool_context: ToolContext, report: str) -> Dict:
     """Analyzes an environmental report for key findings.
@@ -162,7 +581,7 @@ def analyze_environmental_report(tool_context: ToolContext, report: str) -> Dict
     Returns:
         Dict: A dictionary containing key findings from the report.
     """
-    return {"key_findings": ["No endangered species", "Low water usage"]}
+    return _analyze_environmental_report(report)
 
 def find_nearest_electrical_hub(tool_context: ToolContext, latitude: float, longitude: float) -> Dict:
     """Finds the nearest electrical hub and estimates connection costs.
@@ -174,15 +593,78 @@ def find_nearest_electrical_hub(tool_context: ToolContext, latitude: float, long
     Returns:
         Dict: A dictionary containing distance and estimated connection cost.
     """
-    return {"distance": 5, "estimated_cost": 50000}
+    return _find_nearest_electrical_hub(round(latitude, 4), round(longitude, 4))
+
+async def _prefetch_site_data(location: str) -> Dict:
+    """Runs the per-location lookups as a dependency DAG.
+
+    The lat/long lookup runs alongside the lookups that only need the location (social media, lawsuits),
+    and the coordinate-based lookups (imagery, land ownership, grid) start as soon as it resolves.
+    The lookups stand in for blocking network calls (geocoding, Earth Engine, social media APIs), so
+    each one runs in a worker thread; for the in-memory stubs this is pure overhead.
+    """
+    # gather schedules these immediately, so they overlap with the lat/long lookup below
+    location_lookups = asyncio.gather(
+        asyncio.to_thread(_search_social_media, location),
+        asyncio.to_thread(_check_lawsuits, location),
+    )
+    try:
+        coords = await asyncio.to_thread(_get_lat_long, location)
+        latitude, longitude = round(coords["latitude"], 4), round(coords["longitude"], 4)
+        coordinate_lookups = await asyncio.gather(
+            asyncio.to_thread(_get_earth_engine_images, latitude, longitude),
+            asyncio.to_thread(_check_landownership, latitude, longitude),
+            asyncio.to_thread(_find_nearest_electrical_hub, latitude, longitude),
+        )
+        location_results = await location_lookups
+    finally:
+        # Don't leave the location lookups running, or their errors unretrieved, if anything above failed
+        location_lookups.cancel()
+        await asyncio.gather(location_lookups, return_exceptions=True)
+
+    site_data = {"location": location, **coords}
+    for result in [*location_results, *coordinate_lookups]:
+        site_data.update(result)
+    return site_data
+
+async def _prefetch_sites_data(locations: List[str]) -> List[Dict]:
+    """Runs the per-location lookup DAGs for all locations concurrently (the agents themselves are not run here)."""
+    site_lookups = [asyncio.create_task(_prefetch_site_data(location)) for location in locations]
+    try:
+        return await asyncio.gather(*site_lookups)
+    finally:
+        # If one location failed, don't leave the others running or their errors unretrieved
+        for site_lookup in site_lookups:
+            site_lookup.cancel()
+        await asyncio.gather(*site_lookups, return_exceptions=True)
+
+async def prefetch_site_data_async(tool_context: ToolContext, locations: List[str]) -> Dict:
+    """Resolves the coordinates of every location and prefetches their site data in parallel.
+
+    All locations are processed concurrently, and the lookups are cached, so the research agents
+    reuse these results instead of repeating them.
+
+    Args:
+        locations (List[str]): The names of the locations to compare.
+
+    Returns:
+        Dict: A dictionary containing one entry per location under "sites", each with the location,
+        latitude, longitude and the prefetched image URLs, social media posts, lawsuits, land
+        ownership and grid connection data.
+    """
+    # Image analysis comes later in the workflow, so overlap its cold start with the lookups
+    _start_client_warmup()
+    return {"sites": await _prefetch_sites_data(locations)}
+
+prefetch_site_data = _sync_tool(prefetch_site_data_async)
 
 
 # --- Agents ---
 imagery_agent = Agent(
     name="satellite_imagery_agent",
     model="gemini-1.5-flash-002",
-    tools=[get_lat_long, get_earth_engine_images, analyze_satellite_images],
-    instruction="Use the tools at your disposal to Get lat/long, retrieve images, analyze, and assess viability.",
+    tools=[get_earth_engine_images, analyze_satellite_images],
+    instruction="Use the tools at your disposal to retrieve images for the provided lat/long, analyze, and assess viability.",
 )
 
 sentiment_agent = Agent(
@@ -196,7 +678,7 @@ land_agent = Agent(
     name="land_ownership_agent",
     model="gemini-1.5-flash-002",
     tools=[check_landownership],
-    instruction="Use the tools at your disposal to Check land ownership and assess acquisition difficulty.",
+    instruction="Use the tools at your disposal to Check land ownership for the provided lat/long and assess acquisition difficulty.",
 )
 
 impact_agent = Agent(
@@ -210,23 +692,46 @@ grid_agent = Agent(
     name="electrical_grid_agent",
     model="gemini-1.5-flash-002",
     tools=[find_nearest_electrical_hub],
-    instruction="Use the tools at your disposal to Find nearest hub and estimate connection costs.",
+    instruction="Use the tools at your disposal to Find nearest hub to the provided lat/long and estimate connection costs.",
+)
+
+# The five research agents have no data dependencies on each other, so they fan out in parallel.
+# Covering every location at once is only asked for in the instruction, and nothing enforces it;
+# the per-location fan-out that is actually concurrent in code is prefetch_site_data's lookups.
+research_agent = Agent(
+    name="site_research_agent",
+    model="gemini-1.5-flash-002",
+    tools=[],
+    flow='parallel',
+    children=[imagery_agent, sentiment_agent, land_agent, impact_agent, grid_agent],
+    instruction="Run all of the agents at your disposal for every location and lat/long you are given, covering all locations at once, and return each of their outputs per location.",
+)
+
+synthesizer_agent = Agent(
+    name="report_synthesizer_agent",
+    model="gemini-1.5-flash-002",
+    tools=[],
+    instruction="""You are given the outputs of the imagery, sentiment, land, impact and grid agents for each location.
+    1) Combine the outputs and produce two separate reports (one per location).
+    2) Create a final report comparing both locations and providing a recommendation.
+""",
 )
 
 control_agent = Agent(
     name="control_agent",
     model="gemini-1.5-flash-002",
-    tools=[],
+    tools=[prefetch_site_data],
     flow='sequential',
-    children=[imagery_agent, sentiment_agent, land_agent, impact_agent, grid_agent],
-    instruction="""You are the control agent. Use the Agents at your disposal to gather the following info: 
-    1) Analyze the satellite imagery of the location you are requesting - use the imagery_agent to gather that info
-    2) Search for the social media and lawsuits of the location you are requesting to understand local sentiment - use the sentiment_agent to gather that info
-    3) Check on landownership and understand if there are issues to be concerned with  - use the land_agent to gather that info
-    4) Analyze the environmental impact reports and summarize the key info - use the impact_agent to gather that info
-    5) get the information related to the electrical grid and any costs related to connecting to the nearest substation use the grid_agent to gather that info
-    6) Once all the information is collected, combine outputs, and produce two separate reports (one per location).  
-    7)Create a final report comparing both locations and providing a recommendation.
+    children=[research_agent, synthesizer_agent],
+    instruction="""You are the control agent. For the locations you are requesting:
+    1) Call prefetch_site_data once with all of the locations and pass every location and lat/long it returns to the site_research_agent in a single hand-off
+    2) The site_research_agent gathers the following info in parallel, for all locations at once:
+       - the satellite imagery of the location (imagery_agent)
+       - the social media and lawsuits of the location to understand local sentiment (sentiment_agent)
+       - landownership and any issues to be concerned with (land_agent)
+       - the environmental impact reports and their key info (impact_agent)
+       - the electrical grid and any costs related to connecting to the nearest substation (grid_agent)
+    3) Once the information for every location is collected, hand every output to the report_synthesizer_agent to produce the per-location reports and the final comparison.
     - please use only the agents to fulfill all user request
 """,
 )